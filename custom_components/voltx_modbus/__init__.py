@@ -14,12 +14,20 @@ Setup sequence per entry:
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
-
-from .const import CONF_SCAN_INTERVAL, CONF_SLAVE_ID, DEFAULT_SCAN_INTERVAL
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CONF_BATCH_MODE,
+    CONF_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    DEFAULT_BATCH_MODE,
+    DEFAULT_SCAN_INTERVAL,
+)
 from .coordinator import VoltxModbusCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,12 +38,32 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER, Platform.SELECT]
 type VoltxModbusConfigEntry = ConfigEntry[VoltxModbusCoordinator]
 
 
+@callback
+def async_disabled_keys(hass: HomeAssistant, entry: ConfigEntry, domain: Platform) -> frozenset[str]:
+    """Return the data keys whose *domain* entities the user has disabled in the entity registry.
+
+    Platforms skip these at setup instead of building entities HA would discard.
+    Filtered by domain because a key can back entities on more than one platform
+    (chpwr is both a sensor and a number) with the same unique ID.
+    Keys with no registry entry are never included, so new entities (including
+    disabled-by-default ones) still get registered.  Re-enabling an entity makes
+    HA reload the config entry, which creates it again.
+    """
+    prefix = f"{entry.unique_id}_"
+    return frozenset(
+        reg.unique_id.removeprefix(prefix)
+        for reg in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if reg.disabled and reg.domain == domain and reg.unique_id.startswith(prefix)
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: VoltxModbusConfigEntry) -> bool:
     """Set up a Voltx Modbus device from a config entry."""
     host: str = entry.data[CONF_HOST]
     port: int = entry.data[CONF_PORT]
     slave_id: int = entry.data[CONF_SLAVE_ID]
     scan_interval: int = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    batch_mode: str = entry.options.get(CONF_BATCH_MODE, DEFAULT_BATCH_MODE)
 
     coordinator = VoltxModbusCoordinator(
         hass=hass,
@@ -43,6 +71,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: VoltxModbusConfigEntry)
         port=port,
         slave_id=slave_id,
         scan_interval=scan_interval,
+        batch_mode=batch_mode,
     )
 
     # First refresh – raises ConfigEntryNotReady on failure (HA will retry).
@@ -54,9 +83,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: VoltxModbusConfigEntry)
     # Forward entity registration to the sensor platform.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Reload the entry when the user changes options (e.g. scan interval).
+    # Apply option changes (scan interval, read strategy) when the user edits them.
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
+    # HA does not unload entries when it stops, so release the socket and the
+    # executor worker here too; otherwise the final thread join waits on it.
+    async def _async_close(_event: Event) -> None:
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close))
+
     return True
 
 
@@ -64,10 +100,32 @@ async def _async_update_listener(
     hass: HomeAssistant,
     entry: VoltxModbusConfigEntry,
 ) -> None:
-    """Reload the config entry when options are updated."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply updated options to the running coordinator.
+
+    Scan interval and read strategy are applied in place, avoiding a
+    teardown, TCP reconnect and entity re-registration.  The entry is only
+    reloaded if the connection parameters no longer match the coordinator.
+    """
+    coordinator = entry.runtime_data
+    if (
+        entry.data[CONF_HOST] != coordinator.host
+        or entry.data[CONF_PORT] != coordinator.port
+        or entry.data[CONF_SLAVE_ID] != coordinator.slave_id
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    scan_interval: int = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    coordinator.update_interval = timedelta(seconds=scan_interval)
+    coordinator.batch_mode = entry.options.get(CONF_BATCH_MODE, DEFAULT_BATCH_MODE)
+    # Poll now so the new settings take effect and the next poll is rescheduled.
+    await coordinator.async_request_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: VoltxModbusConfigEntry) -> bool:
     """Unload a Voltx Modbus config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        # Close the persistent Modbus TCP connection held by the coordinator.
+        await entry.runtime_data.async_shutdown()
+    return unload_ok
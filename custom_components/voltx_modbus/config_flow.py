@@ -1,14 +1,16 @@
 """Config flow for Voltx Modbus integration.
 
-Handles initial user setup and options (scan interval).  Multiple devices can
-be added by running the flow again with a different host / slave ID.  The
-unique-id is derived from ``{host}:{port}:{slave_id}`` so duplicate entries
-are rejected automatically.
+Handles initial user setup and options (scan interval, register read
+strategy).  Multiple devices can be added by running the flow again with a
+different host / slave ID.  The unique-id is derived from
+``{host}:{port}:{slave_id}`` so duplicate entries are rejected automatically.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -18,50 +20,86 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.helpers import selector
 
 from .const import (
+    BATCH_MODE_CONTIGUOUS,
+    BATCH_MODE_SPLIT,
+    CONF_BATCH_MODE,
     CONF_SCAN_INTERVAL,
     CONF_SLAVE_ID,
+    DEFAULT_BATCH_MODE,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLAVE_ID,
     DOMAIN,
 )
+from .coordinator import VoltxModbusCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _user_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
+def _user_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     """Return the config-flow form schema, pre-filled with *defaults*."""
     d = defaults or {}
+    return _build_user_schema(
+        d.get(CONF_HOST, ""),
+        d.get(CONF_PORT, DEFAULT_PORT),
+        d.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID),
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_user_schema(host: str, port: float, slave_id: float) -> vol.Schema:
+    """Build the config-flow form schema; cached per set of default values."""
     return vol.Schema(
         {
-            vol.Required(CONF_HOST, default=d.get(CONF_HOST, "")): selector.TextSelector(
+            vol.Required(CONF_HOST, default=host): selector.TextSelector(
                 selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
             ),
-            vol.Required(CONF_PORT, default=d.get(CONF_PORT, DEFAULT_PORT)): selector.NumberSelector(
+            vol.Required(CONF_PORT, default=port): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=1, max=65535, mode=selector.NumberSelectorMode.BOX)
             ),
-            vol.Required(CONF_SLAVE_ID, default=d.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)): selector.NumberSelector(
+            vol.Required(CONF_SLAVE_ID, default=slave_id): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=1, max=247, mode=selector.NumberSelectorMode.BOX)
             ),
         }
     )
 
 
-def _options_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
+def _options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     """Return the options-flow form schema."""
     d = defaults or {}
+    return _build_options_schema(
+        d.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        d.get(CONF_BATCH_MODE, DEFAULT_BATCH_MODE),
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_options_schema(scan_interval: float, batch_mode: str) -> vol.Schema:
+    """Build the options-flow form schema; cached per set of default values."""
     return vol.Schema(
         {
-            vol.Required(
-                CONF_SCAN_INTERVAL,
-                default=d.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-            ): selector.NumberSelector(
+            vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=5, max=3600, step=5, mode=selector.NumberSelectorMode.SLIDER)
             ),
+            vol.Required(CONF_BATCH_MODE, default=batch_mode): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[BATCH_MODE_CONTIGUOUS, BATCH_MODE_SPLIT],
+                    translation_key=CONF_BATCH_MODE,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
         }
     )
 
 
+def _normalize(user_input: dict[str, Any]) -> tuple[str, int, int, str, str]:
+    """Return (host, port, slave_id, unique_id, title) for a submitted form."""
+    host = user_input[CONF_HOST].strip()
+    port = int(user_input[CONF_PORT])
+    slave_id = int(user_input[CONF_SLAVE_ID])
+    return host, port, slave_id, f"{host}_{port}_{slave_id}", f"Voltx {host} (slave {slave_id})"
+
+
 async def _validate_connection(
     hass,
     host: str,
@@ -69,23 +107,8 @@ async def _validate_connection(
     slave_id: int,
 ) -> str | None:
     """Try one register read; return an error key string or None on success."""
-    from pyModbusTCP.client import ModbusClient  # noqa: PLC0415
-
-    def _try_connect() -> bool:
-        client = ModbusClient(host=host, port=int(port), unit_id=int(slave_id), timeout=5)
-        try:
-            if not client.open():
-                return False
-            # Read the working-hours register (1307) as a quick sanity check.
-            result = client.read_input_registers(1307, 1)
-            return result is not None
-        except Exception:  # noqa: BLE001
-            return False
-        finally:
-            client.close()
-
     try:
-        ok = await hass.async_add_executor_job(_try_connect)
+        ok = await VoltxModbusCoordinator.async_validate(hass, host, port, slave_id)
     except Exception:  # noqa: BLE001
         return "cannot_connect"
     return None if ok else "cannot_connect"
@@ -111,12 +134,9 @@ class VoltxModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST].strip()
-            port = int(user_input[CONF_PORT])
-            slave_id = int(user_input[CONF_SLAVE_ID])
+            host, port, slave_id, unique_id, title = _normalize(user_input)
 
             # Prevent duplicate entries for the same device.
-            unique_id = f"{host}_{port}_{slave_id}"
             await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
 
@@ -126,7 +146,7 @@ class VoltxModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = error
             else:
                 return self.async_create_entry(
-                    title=f"Voltx {host} (slave {slave_id})",
+                    title=title,
                     data={
                         CONF_HOST: host,
                         CONF_PORT: port,
@@ -149,9 +169,7 @@ class VoltxModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST].strip()
-            port = int(user_input[CONF_PORT])
-            slave_id = int(user_input[CONF_SLAVE_ID])
+            host, port, slave_id, unique_id, title = _normalize(user_input)
 
             error = await _validate_connection(self.hass, host, port, slave_id)
             if error:
@@ -159,8 +177,8 @@ class VoltxModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_update_reload_and_abort(
                     entry,
-                    unique_id=f"{host}_{port}_{slave_id}",
-                    title=f"Voltx {host} (slave {slave_id})",
+                    unique_id=unique_id,
+                    title=title,
                     data={
                         CONF_HOST: host,
                         CONF_PORT: port,
@@ -176,7 +194,7 @@ class VoltxModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
 
 class VoltxModbusOptionsFlow(config_entries.OptionsFlow):
-    """Handle options (scan interval)."""
+    """Handle options (scan interval and register read strategy)."""
 
     async def async_step_init(
         self,
@@ -186,7 +204,10 @@ class VoltxModbusOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(
                 title="",
-                data={CONF_SCAN_INTERVAL: int(user_input[CONF_SCAN_INTERVAL])},
+                data={
+                    CONF_SCAN_INTERVAL: int(user_input[CONF_SCAN_INTERVAL]),
+                    CONF_BATCH_MODE: user_input[CONF_BATCH_MODE],
+                },
             )
 
         return self.async_show_form(
@@ -12,3 +12,9 @@ DEFAULT_SCAN_INTERVAL = 30  # seconds
 
 # Options
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_BATCH_MODE = "batch_mode"
+
+# Register read strategies for the 1300–1379 inverter block
+BATCH_MODE_CONTIGUOUS = "contiguous"  # one 80-register request
+BATCH_MODE_SPLIT = "split"  # only the used spans, skipping the 1317–1357 hole
+DEFAULT_BATCH_MODE = BATCH_MODE_CONTIGUOUS
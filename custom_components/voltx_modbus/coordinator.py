@@ -1,8 +1,11 @@
 """Data coordinator for Voltx Modbus integration.
 
 Polls the inverter via Modbus TCP and provides data to all sensor entities.
-All register reads run in a thread-pool executor to avoid blocking the
-Home Assistant event loop (pyModbusTCP is synchronous).
+All register reads and writes run on a single-worker thread pool owned by the
+coordinator, to avoid blocking the Home Assistant event loop (pyModbusTCP is
+synchronous) without queueing behind other integrations on HA's shared
+executor.  The single worker also serialises access to the poll connection,
+which is kept open between polls and only re-established after it drops.
 
 Register map (verified on Solplanet/Voltx ASW010K-SH, firmware v2, slave ID 3).
 Doc source: MB001_ASW GEN-Modbus-en_V2.1.5 (AISWEI).
@@ -46,32 +49,91 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import struct
 import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pyModbusTCP.client import ModbusClient
 
-from .const import DOMAIN
+from .const import BATCH_MODE_CONTIGUOUS, BATCH_MODE_SPLIT, DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Stand-in for coordinator.data before the first successful poll.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 # ── Modbus decoding helpers ───────────────────────────────────────────────────
 
 
 def _s16(raw: int) -> int:
     """Interpret a raw u16 register value as signed int16."""
-    return struct.unpack(">h", struct.pack(">H", raw & 0xFFFF))[0]
+    raw &= 0xFFFF
+    return raw - 0x10000 if raw & 0x8000 else raw
 
 
 def _s32(hi: int, lo: int) -> int:
     """Combine two raw u16 registers into a signed int32 (big-endian word order)."""
     raw = ((hi & 0xFFFF) << 16) | (lo & 0xFFFF)
-    return struct.unpack(">i", struct.pack(">I", raw))[0]
+    return raw - 0x100000000 if raw & 0x80000000 else raw
+
+
+def _u32(hi: int, lo: int) -> int:
+    """Combine two raw u16 registers into an unsigned int32 (big-endian word order)."""
+    return ((hi & 0xFFFF) << 16) | (lo & 0xFFFF)
+
+
+def _decode_fields(
+    regs: list[int],
+    u16: tuple[tuple[str, int, int | None], ...] = (),
+    s16: tuple[tuple[str, int, int | None], ...] = (),
+    u32: tuple[tuple[str, int, int | None], ...] = (),
+    s32: tuple[tuple[str, int], ...] = (),
+) -> dict[str, Any]:
+    """Decode the table-driven fields of one register block into a new dict."""
+    data: dict[str, Any] = {}
+    for key, offset, divisor in u16:
+        raw = regs[offset]
+        data[key] = raw if divisor is None else raw / divisor
+    for key, offset, divisor in s16:
+        raw = _s16(regs[offset])
+        data[key] = raw if divisor is None else raw / divisor
+    for key, offset, divisor in u32:
+        raw = _u32(regs[offset], regs[offset + 1])
+        data[key] = raw if divisor is None else raw / divisor
+    for key, offset in s32:
+        data[key] = _s32(regs[offset], regs[offset + 1])
+    return data
+
+
+def _read_spans(
+    read: Callable[[int, int], list[int] | None],
+    base: int,
+    size: int,
+    spans: tuple[tuple[int, int], ...],
+) -> list[int] | None:
+    """Read each (address, count) span into a *size*-register frame starting at *base*.
+
+    Registers outside the spans are left at 0, so the decode tables can index
+    the frame with the same block-relative offsets however it was read.
+    Returns None if any span read fails.
+    """
+    frame = [0] * size
+    for address, count in spans:
+        regs = read(address, count)
+        if regs is None or len(regs) < count:
+            return None
+        offset = address - base
+        frame[offset : offset + count] = regs[:count]
+    return frame
 
 
 # ── Inverter status code map ─────────────────────────────────────────────────
@@ -98,6 +160,83 @@ _CHFLG: dict[int, str] = {
     3: "Discharging",
 }
 
+# ── Register decode tables ───────────────────────────────────────────────────
+#
+# Offsets are relative to each block's base address.  Scaled entries are
+# (key, offset, divisor); a divisor of None stores the raw value.  Dividing by
+# 10 or 100 (rather than multiplying by 0.1) gives the shortest float for the
+# decimal, e.g. 1617 / 10 == 161.7, so no rounding is needed.
+# 32-bit entries give the offset of the high word.  _decode_fields handles
+# every table; enum and special-case registers are decoded by hand in the
+# block readers.
+
+# Input register block 1: inverter data (1300–1379)
+# Read either as one request, or as the three used spans so the 1317–1357
+# hole is not transferred (worthwhile on slow TCP-to-RS485 gateways).
+_INV_BASE = 1300
+_INV_SIZE = 80
+_INV_SPANS: dict[str, tuple[tuple[int, int], ...]] = {
+    BATCH_MODE_CONTIGUOUS: ((1300, 80),),
+    BATCH_MODE_SPLIT: ((1307, 4), (1316, 1), (1358, 17)),
+}
+_INV_U16: tuple[tuple[str, int, int | None], ...] = (
+    ("hto", 1307 - _INV_BASE, None),  # total working hours h
+    ("vbus", 1316 - _INV_BASE, 10),  # DC bus voltage V
+    ("vac", 1358 - _INV_BASE, 10),  # grid voltage V
+    ("iac", 1359 - _INV_BASE, 10),  # AC phase current A
+    ("fac", 1367 - _INV_BASE, 100),  # grid frequency Hz
+    ("pf", 1374 - _INV_BASE, 100),  # power factor
+)
+_INV_S32: tuple[tuple[str, int], ...] = (
+    ("sac", 1368 - _INV_BASE),  # apparent power VA
+    ("pac", 1370 - _INV_BASE),  # active power W
+    ("qac", 1372 - _INV_BASE),  # reactive power VAr
+)
+_INV_FLG = 1308 - _INV_BASE  # inverter status enum
+_INV_TMP = 1310 - _INV_BASE  # inverter temperature s16 ×0.1 °C (0x8000 = not fitted)
+
+# Input register block 2: battery status and data (1606–1628)
+_BATT_BASE = 1606
+_BATT_U16: tuple[tuple[str, int, int | None], ...] = (
+    ("bcomm", 1606 - _BATT_BASE, None),  # battery comm status raw
+    ("vb", 1616 - _BATT_BASE, 100),  # battery voltage V
+    ("soc", 1621 - _BATT_BASE, None),  # state of charge %
+    ("soh", 1622 - _BATT_BASE, None),  # state of health %
+    ("cli", 1623 - _BATT_BASE, 10),  # charge current limit A
+    ("clo", 1624 - _BATT_BASE, 10),  # discharge current limit A
+)
+_BATT_S16: tuple[tuple[str, int, int | None], ...] = (
+    ("cb", 1617 - _BATT_BASE, 10),  # battery current A (neg=charging)
+    ("tb", 1620 - _BATT_BASE, 10),  # battery temperature °C
+)
+_BATT_S32: tuple[tuple[str, int], ...] = (
+    ("pb", 1618 - _BATT_BASE),  # battery power W (neg=charging)
+)
+_BATT_U32: tuple[tuple[str, int, int | None], ...] = (
+    ("e_chg_today", 1625 - _BATT_BASE, 10),  # battery energy charged today kWh
+    ("e_dis_today", 1627 - _BATT_BASE, 10),  # battery energy discharged today kWh
+)
+_BATT_BST = 1607 - _BATT_BASE  # battery operating status enum
+
+# Holding register block: inverter settings (1100–1154)
+# Only 1103 and 1150–1154 are used, so the block is read as two spans rather
+# than one 55-register request.
+_SET_BASE = 1100
+_SET_SIZE = 55
+_SET_SPANS: tuple[tuple[int, int], ...] = ((1103, 1), (1150, 5))
+_SET_U16: tuple[tuple[str, int, int | None], ...] = (
+    ("work_mode", 1103 - _SET_BASE, None),  # work mode enum
+    ("cloud_status", 1150 - _SET_BASE, None),  # cloud comm status (0x000A=10=Online)
+)
+_SET_S16: tuple[tuple[str, int, int | None], ...] = (
+    ("chpwr", 1152 - _SET_BASE, None),  # charge/discharge power cmd W (neg=charge)
+)
+_SET_PERCENT: tuple[tuple[str, int], ...] = (
+    ("soc_max", 1153 - _SET_BASE),  # SOC max % (raw ÷100)
+    ("soc_min", 1154 - _SET_BASE),  # SOC min % (raw ÷100)
+)
+_SET_CHFLG = 1151 - _SET_BASE  # charge/discharge flag enum (read-only status)
+
 # ── Coordinator ───────────────────────────────────────────────────────────────
 
 
@@ -116,6 +255,7 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         port: int,
         slave_id: int,
         scan_interval: int,
+        batch_mode: str = BATCH_MODE_CONTIGUOUS,
     ) -> None:
         """Initialise the coordinator."""
         super().__init__(
@@ -127,129 +267,205 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.host = host
         self.port = port
         self.slave_id = slave_id
+        # Inverter block read strategy; the setter binds the matching span plan.
+        self._inv_spans: tuple[tuple[int, int], ...] = _INV_SPANS[batch_mode]
+        self._batch_mode = batch_mode
+        # Long-lived poll connection, opened lazily and reopened after a drop.
+        # Only touched from the worker thread of self._executor.
+        self._client: ModbusClient | None = None
+        # Per-entry single-worker pool for blocking Modbus I/O, created lazily.
+        self._executor: ThreadPoolExecutor | None = None
+        # Last successfully decoded values and consecutive read misses, per block.
+        self._last_good: dict[str, dict[str, Any]] = {}
+        self._block_misses: dict[str, int] = {}
+
+    @property
+    def batch_mode(self) -> str:
+        """Inverter block read strategy (BATCH_MODE_CONTIGUOUS or BATCH_MODE_SPLIT)."""
+        return self._batch_mode
+
+    @batch_mode.setter
+    def batch_mode(self, value: str) -> None:
+        """Switch read strategy, resolving its span plan once rather than per poll."""
+        self._inv_spans = _INV_SPANS[value]
+        self._batch_mode = value
+
+    def value_getter(self, key: str) -> Callable[[], Any]:
+        """Return a callable that reads *key* from the latest data, or None if absent.
+
+        Entities hold on to this so each state read is a single call rather
+        than a coordinator → data → get chain.
+        """
 
-    # ------------------------------------------------------------------
-    # Internal – runs in a thread-pool executor (blocking I/O allowed)
-    # ------------------------------------------------------------------
+        def _get() -> Any:
+            return (self.data or _EMPTY).get(key)
 
-    def _fetch_data(self) -> dict[str, Any]:
-        """Synchronous Modbus read – called via async_add_executor_job."""
-        # Import here so pyModbusTCP is only loaded in the executor thread.
-        from pyModbusTCP.client import ModbusClient  # noqa: PLC0415
-
-        client = ModbusClient(
-            host=self.host,
-            port=self.port,
-            unit_id=self.slave_id,
-            timeout=5,
-        )
+        return _get
 
-        try:
-            if not client.open():
-                raise UpdateFailed(
-                    f"Cannot open Modbus TCP connection to {self.host}:{self.port} (slave {self.slave_id})"
-                )
+    # ------------------------------------------------------------------
+    # Internal – runs on the coordinator's executor (blocking I/O allowed)
+    # ------------------------------------------------------------------
 
-            data: dict[str, Any] = {}
-
-            # ── Input register block 1: inverter data ─────────────────
-            # Read 1300–1379 (80 registers) in a single request.
-            regs = client.read_input_registers(1300, 80)
-            if regs is not None and len(regs) >= 75:
-                # offsets relative to base address 1300
-                data["hto"] = regs[1307 - 1300]  # working hours
-                flg_raw = regs[1308 - 1300]
-                data["flg"] = _INV_STATUS.get(flg_raw, f"Unknown({flg_raw})")  # inverter status
-                tmp_raw = _s16(regs[1310 - 1300])
-                data["tmp"] = (  # inverter temp °C
-                    None
-                    if tmp_raw == -32768  # 0x8000 = not fitted
-                    else round(tmp_raw * 0.1, 1)
-                )
-                data["vbus"] = round(regs[1316 - 1300] * 0.1, 1)  # DC bus voltage V
-                data["vac"] = round(regs[1358 - 1300] * 0.1, 1)  # grid voltage V
-                data["iac"] = round(regs[1359 - 1300] * 0.1, 1)  # AC phase current A
-                data["fac"] = round(regs[1367 - 1300] * 0.01, 2)  # grid frequency Hz
-                data["sac"] = _s32(regs[1368 - 1300], regs[1369 - 1300])  # apparent power VA
-                data["pac"] = _s32(regs[1370 - 1300], regs[1371 - 1300])  # active power W
-                data["qac"] = _s32(regs[1372 - 1300], regs[1373 - 1300])  # reactive power VAr
-                data["pf"] = round(regs[1374 - 1300] * 0.01, 2)  # power factor
-            else:
-                _LOGGER.debug(
-                    "Failed to read inverter input registers from %s:%d slave %d",
-                    self.host,
-                    self.port,
-                    self.slave_id,
-                )
+    def _connect(self) -> ModbusClient:
+        """Return the poll client, (re)opening the TCP connection if needed."""
+        if self._client is None:
+            self._client = ModbusClient(
+                host=self.host,
+                port=self.port,
+                unit_id=self.slave_id,
+                timeout=5,
+            )
+        if not self._client.is_open and not self._client.open():
+            raise UpdateFailed(
+                f"Cannot open Modbus TCP connection to {self.host}:{self.port} (slave {self.slave_id})"
+            )
+        return self._client
 
-            # ── Input register block 2a: battery status ────────────────
-            # Read 1606–1607 (2 registers): comm status and operating status.
-            bsregs = client.read_input_registers(1606, 2)
-            if bsregs is not None and len(bsregs) >= 2:
-                bcomm_raw = bsregs[0]
-                data["bcomm"] = bcomm_raw  # battery comm status raw
-                bst_raw = bsregs[1]
-                data["bst"] = _BATT_STATUS.get(bst_raw, f"Unknown({bst_raw})")  # battery op status
-            else:
-                _LOGGER.debug(
-                    "Failed to read battery status registers from %s:%d slave %d",
-                    self.host,
-                    self.port,
-                    self.slave_id,
-                )
+    def _disconnect(self) -> None:
+        """Close and drop the poll client so the next poll reconnects."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
-            # ── Input register block 2b: battery data ────────────────────
-            # Read 1616–1628 (13 registers): voltage, current, power, temps,
-            # SOC/SOH, current limits, and energy-today counters.
-            bregs = client.read_input_registers(1616, 13)
-            if bregs is not None and len(bregs) >= 13:
-                data["vb"] = round(bregs[0] * 0.01, 2)  # battery voltage V
-                data["cb"] = round(_s16(bregs[1]) * 0.1, 1)  # battery current A (S16: neg=charging)
-                data["pb"] = _s32(bregs[2], bregs[3])  # battery power W
-                data["tb"] = round(_s16(bregs[4]) * 0.1, 1)  # battery temperature °C
-                data["soc"] = bregs[5]  # state of charge %
-                data["soh"] = bregs[6]  # state of health %
-                data["cli"] = round(bregs[7] * 0.1, 1)  # charge current limit A
-                data["clo"] = round(bregs[8] * 0.1, 1)  # discharge current limit A
-                # 1625–1626: battery energy charged today (u32 × 0.1 kWh)
-                e_chg_raw = ((bregs[9] & 0xFFFF) << 16) | (bregs[10] & 0xFFFF)
-                data["e_chg_today"] = round(e_chg_raw * 0.1, 1)  # kWh
-                # 1627–1628: battery energy discharged today (u32 × 0.1 kWh)
-                e_dis_raw = ((bregs[11] & 0xFFFF) << 16) | (bregs[12] & 0xFFFF)
-                data["e_dis_today"] = round(e_dis_raw * 0.1, 1)  # kWh
-            else:
-                _LOGGER.debug(
-                    "Failed to read battery input registers from %s:%d slave %d",
-                    self.host,
-                    self.port,
-                    self.slave_id,
-                )
-
-            # ── Holding register block: inverter settings ─────────────
-            # Read 1100–1154 (55 registers) in a single request.
-            sregs = client.read_holding_registers(1100, 55)
-            if sregs is not None and len(sregs) >= 55:
-                data["work_mode"] = sregs[1103 - 1100]  # work mode enum
-                data["cloud_status"] = sregs[1150 - 1100]  # cloud comm status (0x000A=10=Online)
-                chflg_raw = sregs[1151 - 1100]
-                data["chflg"] = _CHFLG.get(
-                    chflg_raw, f"Unknown({chflg_raw})"
-                )  # charge/discharge flag (read-only status)
-                data["chpwr"] = _s16(sregs[1152 - 1100])  # charge/discharge power cmd W (neg=charge)
-                data["soc_max"] = sregs[1153 - 1100] // 100  # SOC max % (raw ÷100)
-                data["soc_min"] = sregs[1154 - 1100] // 100  # SOC min % (raw ÷100)
+    def _fetch_data(self) -> dict[str, Any]:
+        """Synchronous Modbus read – called via _async_run."""
+        try:
+            client = self._connect()
+        except UpdateFailed as err:
+            # An unreachable gateway counts as a miss for every block, so
+            # last-good data also rides out a single dropped connection.
+            _LOGGER.debug("%s; counting a missed read for every block", err)
+            try:
+                return self._read_blocks(None)
+            except UpdateFailed:
+                raise err from None
+        try:
+            data = self._read_blocks(client)
+        except Exception:
+            # Drop a connection in an unknown state; the next poll reopens it.
+            client.close()
+            self._client = None
+            raise
+        if not client.is_open:
+            # pyModbusTCP closes the socket itself on timeouts and receive
+            # errors; forget the client so the next poll starts clean.
+            self._client = None
+        return data
+
+    def _read_blocks(self, client: ModbusClient | None) -> dict[str, Any]:
+        """Read and decode all register blocks over an open *client*.
+
+        With *client* None (the connection could not be opened) every block
+        is treated as a failed read.
+
+        A block whose read fails keeps serving its last-good values until it
+        has missed _STALE_MAX_POLLS consecutive polls, when they are dropped,
+        so a single dropped request does not flip its entities to Unavailable.
+        UpdateFailed is only raised when no block has fresh or still-usable
+        last-good data.
+        """
+        data: dict[str, Any] = {}
+        for name, read_block in (
+            ("inverter", self._read_inverter),
+            ("battery", self._read_battery),
+            ("settings", self._read_settings),
+        ):
+            block = read_block(client) if client is not None else None
+            if block is not None:
+                self._block_misses[name] = 0
+                self._last_good[name] = block
             else:
+                misses = self._block_misses.get(name, 0) + 1
+                self._block_misses[name] = misses
+                if misses >= self._STALE_MAX_POLLS:
+                    # Stale for too long – drop it so its entities go unavailable.
+                    self._last_good.pop(name, None)
+                block = self._last_good.get(name)
+                if block is None:
+                    continue
                 _LOGGER.debug(
-                    "Failed to read settings holding registers from %s:%d slave %d",
+                    "Serving last-good %s data for %s:%d slave %d (miss %d/%d)",
+                    name,
                     self.host,
                     self.port,
                     self.slave_id,
+                    misses,
+                    self._STALE_MAX_POLLS,
                 )
+            data.update(block)
 
-            return data
+        if not data:
+            raise UpdateFailed(
+                f"No register block could be read from {self.host}:{self.port} (slave {self.slave_id})"
+            )
+        return data
+
+    def _read_inverter(self, client: ModbusClient) -> dict[str, Any] | None:
+        """Read input register block 1 (inverter data); None on failure."""
+        # Read 1300–1379 in one request, or 1307–1310, 1316 and 1358–1374 in split mode.
+        regs = _read_spans(client.read_input_registers, _INV_BASE, _INV_SIZE, self._inv_spans)
+        if regs is None:
+            _LOGGER.debug(
+                "Failed to read inverter input registers from %s:%d slave %d",
+                self.host,
+                self.port,
+                self.slave_id,
+            )
+            return None
+
+        data = _decode_fields(regs, u16=_INV_U16, s32=_INV_S32)
+        flg_raw = regs[_INV_FLG]
+        label = _INV_STATUS.get(flg_raw)
+        data["flg"] = label if label is not None else f"Unknown({flg_raw})"  # inverter status
+        tmp_raw = _s16(regs[_INV_TMP])
+        data["tmp"] = (  # inverter temp °C
+            None
+            if tmp_raw == -32768  # 0x8000 = not fitted
+            else tmp_raw / 10
+        )
+        return data
+
+    def _read_battery(self, client: ModbusClient) -> dict[str, Any] | None:
+        """Read input register block 2 (battery status and data); None on failure."""
+        # Read 1606–1628 (23 registers) in a single request: comm and
+        # operating status, then voltage, current, power, temps, SOC/SOH,
+        # current limits and energy-today counters.  1608–1615 are unused.
+        regs = client.read_input_registers(_BATT_BASE, 23)
+        if regs is None or len(regs) < 23:
+            _LOGGER.debug(
+                "Failed to read battery input registers from %s:%d slave %d",
+                self.host,
+                self.port,
+                self.slave_id,
+            )
+            return None
+
+        data = _decode_fields(regs, u16=_BATT_U16, s16=_BATT_S16, u32=_BATT_U32, s32=_BATT_S32)
+        bst_raw = regs[_BATT_BST]
+        label = _BATT_STATUS.get(bst_raw)
+        data["bst"] = label if label is not None else f"Unknown({bst_raw})"  # battery op status
+        return data
+
+    def _read_settings(self, client: ModbusClient) -> dict[str, Any] | None:
+        """Read the holding register block (inverter settings); None on failure."""
+        # Read 1103 and 1150–1154 (6 of the 55 registers in 1100–1154).
+        regs = _read_spans(client.read_holding_registers, _SET_BASE, _SET_SIZE, _SET_SPANS)
+        if regs is None:
+            _LOGGER.debug(
+                "Failed to read settings holding registers from %s:%d slave %d",
+                self.host,
+                self.port,
+                self.slave_id,
+            )
+            return None
 
-        finally:
-            client.close()
+        data = _decode_fields(regs, u16=_SET_U16, s16=_SET_S16)
+        for key, offset in _SET_PERCENT:
+            data[key] = regs[offset] // 100
+        chflg_raw = regs[_SET_CHFLG]
+        label = _CHFLG.get(chflg_raw)
+        data["chflg"] = label if label is not None else f"Unknown({chflg_raw})"  # charge/discharge flag
+        return data
 
     # Number of times to attempt a register write before giving up.
     _WRITE_ATTEMPTS = 3
@@ -261,47 +477,38 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # Seconds to wait between read attempts (async sleep, does not block event loop).
     _READ_RETRY_DELAY = 2.0
 
+    # Consecutive failed polls after which a block's last-good values are dropped.
+    _STALE_MAX_POLLS = 3
+
     def _write_register(self, address: int, value: int) -> None:
-        """Synchronous FC06 write with retry – called via async_add_executor_job.
+        """Synchronous FC06 write with retry – called via _async_run.
 
-        Retries up to _WRITE_ATTEMPTS times with a short delay between each
-        attempt so transient TCP glitches do not immediately surface as errors
-        in automations.
+        Sent over the persistent poll connection, which is reopened if it has
+        dropped.  Retries up to _WRITE_ATTEMPTS times with a short delay
+        between each attempt so transient TCP glitches do not immediately
+        surface as errors in automations.
         """
-        from pyModbusTCP.client import ModbusClient  # noqa: PLC0415
-
         last_error: str = ""
 
         for attempt in range(1, self._WRITE_ATTEMPTS + 1):
-            client = ModbusClient(
-                host=self.host,
-                port=self.port,
-                unit_id=self.slave_id,
-                timeout=5,
-            )
             try:
-                if not client.open():
-                    last_error = f"Cannot open Modbus TCP connection to {self.host}:{self.port} (slave {self.slave_id})"
-                    _LOGGER.warning(
-                        "Write attempt %d/%d – %s",
-                        attempt,
-                        self._WRITE_ATTEMPTS,
-                        last_error,
-                    )
-                else:
-                    # Mask to u16 so s16 negative values (e.g. chpwr charging) are
-                    # correctly encoded as two's-complement before transmission.
-                    if client.write_single_register(address, value & 0xFFFF):
-                        return  # success – exit immediately
-                    last_error = f"Write to register {address} failed on {self.host}:{self.port} slave {self.slave_id}"
-                    _LOGGER.warning(
-                        "Write attempt %d/%d – %s",
-                        attempt,
-                        self._WRITE_ATTEMPTS,
-                        last_error,
-                    )
-            finally:
-                client.close()
+                # Reuse the poll connection; the single-worker executor keeps
+                # writes and polls from interleaving on it.
+                client = self._connect()
+            except UpdateFailed as exc:
+                last_error = str(exc)
+            else:
+                # Mask to u16 so s16 negative values (e.g. chpwr charging) are
+                # correctly encoded as two's-complement before transmission.
+                if client.write_single_register(address, value & 0xFFFF):
+                    return  # success – exit immediately
+                last_error = f"Write to register {address} failed on {self.host}:{self.port} slave {self.slave_id}"
+            _LOGGER.warning(
+                "Write attempt %d/%d – %s",
+                attempt,
+                self._WRITE_ATTEMPTS,
+                last_error,
+            )
 
             if attempt < self._WRITE_ATTEMPTS:
                 time.sleep(self._WRITE_RETRY_DELAY)
@@ -311,12 +518,27 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_write_register(self, address: int, value: int) -> None:
         """Write a single holding register then schedule a coordinator refresh.
 
-        The refresh is fired as a background task so the UI call returns
-        immediately without waiting for the next full Modbus poll round-trip.
+        The write is queued on the coordinator's executor behind any poll in
+        progress and reuses its connection.  The refresh is fired as a
+        background task so the UI call returns immediately without waiting
+        for the next full Modbus poll round-trip.
         """
-        await self.hass.async_add_executor_job(self._write_register, address, value)
+        await self._async_run(self._write_register, address, value)
         self.hass.async_create_task(self.async_request_refresh())
 
+    async def _async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run blocking *func* on this coordinator's single-worker executor.
+
+        Jobs run one at a time in submission order, so polls and writes never
+        share the Modbus connection concurrently.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"voltx_modbus_{self.host}_{self.slave_id}",
+            )
+        return await self.hass.loop.run_in_executor(self._executor, func, *args)
+
     # ------------------------------------------------------------------
     # DataUpdateCoordinator interface
     # ------------------------------------------------------------------
@@ -331,7 +553,7 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         last_exc: Exception | None = None
         for attempt in range(1, self._READ_ATTEMPTS + 1):
             try:
-                return await self.hass.async_add_executor_job(self._fetch_data)
+                return await self._async_run(self._fetch_data)
             except UpdateFailed as exc:
                 last_exc = exc
                 _LOGGER.warning(
@@ -351,6 +573,35 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 ) from exc
         raise last_exc  # type: ignore[misc]
 
+    async def async_shutdown(self) -> None:
+        """Cancel polling, close the persistent connection and stop the executor.
+
+        Called on entry unload and on Home Assistant stop; safe to call twice.
+        """
+        await super().async_shutdown()
+        if self._executor is not None:
+            await self._async_run(self._disconnect)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @classmethod
+    async def async_validate(cls, hass: HomeAssistant, host: str, port: int, slave_id: int) -> bool:
+        """Return True if the inverter at host/port/slave_id answers a poll.
+
+        Runs async_validate_connection on a throwaway coordinator so validation
+        goes through the same client and executor code path as polling; its
+        connection is closed before returning.
+        """
+        coordinator = cls(hass, host, port, slave_id, DEFAULT_SCAN_INTERVAL)
+        try:
+            await coordinator.async_validate_connection()
+        except ConfigEntryNotReady as err:
+            _LOGGER.debug("Validation failed: %s", err)
+            return False
+        finally:
+            await coordinator.async_shutdown()
+        return True
+
     async def async_validate_connection(self) -> None:
         """Try a single register read to validate connection parameters.
 
@@ -358,7 +609,7 @@ class VoltxModbusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         can surface the error to the user.
         """
         try:
-            data = await self.hass.async_add_executor_job(self._fetch_data)
+            data = await self._async_run(self._fetch_data)
         except Exception as exc:
             raise ConfigEntryNotReady(
                 f"Cannot connect to inverter at {self.host}:{self.port} slave {self.slave_id}: {exc}"
@@ -7,6 +7,8 @@ Defines two HA devices per config entry:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -40,11 +42,17 @@ BATTERY_KEYS: frozenset[str] = frozenset(
 )
 
 
-def inverter_device_info(entry: ConfigEntry) -> DeviceInfo:
-    """Return DeviceInfo for the inverter device."""
-    uid = entry.unique_id or entry.entry_id
-    host = entry.data[CONF_HOST]
-    slave = entry.data[CONF_SLAVE_ID]
+@lru_cache(maxsize=16)
+def _device_info(uid: str, host: str, slave: int, battery: bool) -> DeviceInfo:
+    """Build the DeviceInfo for one device; cached so entities share a single instance."""
+    if battery:
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{uid}_battery")},
+            name=f"Voltx Battery ({host} slave {slave})",
+            manufacturer="Voltx",
+            model="Battery Storage",
+            via_device=(DOMAIN, uid),
+        )
     return DeviceInfo(
         identifiers={(DOMAIN, uid)},
         name=f"Voltx Inverter ({host} slave {slave})",
@@ -53,22 +61,25 @@ def inverter_device_info(entry: ConfigEntry) -> DeviceInfo:
     )
 
 
+def inverter_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return DeviceInfo for the inverter device."""
+    return _device_info(
+        entry.unique_id or entry.entry_id, entry.data[CONF_HOST], entry.data[CONF_SLAVE_ID], False
+    )
+
+
 def battery_device_info(entry: ConfigEntry) -> DeviceInfo:
     """Return DeviceInfo for the battery device, linked to the inverter."""
-    uid = entry.unique_id or entry.entry_id
-    host = entry.data[CONF_HOST]
-    slave = entry.data[CONF_SLAVE_ID]
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{uid}_battery")},
-        name=f"Voltx Battery ({host} slave {slave})",
-        manufacturer="Voltx",
-        model="Battery Storage",
-        via_device=(DOMAIN, uid),
+    return _device_info(
+        entry.unique_id or entry.entry_id, entry.data[CONF_HOST], entry.data[CONF_SLAVE_ID], True
     )
 
 
 def get_device_info(entry: ConfigEntry, key: str) -> DeviceInfo:
-    """Return the correct DeviceInfo for a given coordinator data key."""
+    """Return the correct DeviceInfo for a given coordinator data key.
+
+    The returned dict is shared between entities on the same device; treat it as read-only.
+    """
     if key in BATTERY_KEYS:
         return battery_device_info(entry)
     return inverter_device_info(entry)
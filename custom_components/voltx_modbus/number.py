@@ -7,7 +7,10 @@ back via FC06 (write single holding register) through the coordinator.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -16,11 +19,12 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, Platform, UnitOfPower
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import async_disabled_keys
 from .coordinator import VoltxModbusCoordinator
 from .device_info import get_device_info
 
@@ -38,51 +42,92 @@ class VoltxNumberEntityDescription(NumberEntityDescription):
 
 # ── Number entity catalogue ───────────────────────────────────────────────────
 
-NUMBER_DESCRIPTIONS: tuple[VoltxNumberEntityDescription, ...] = (
-    VoltxNumberEntityDescription(
-        key="chpwr",
-        name="Battery Charge/Discharge Power",
-        # Positive = discharge, negative = charge (inverter convention).
-        # s16 register — _write_register masks to u16 for two's-complement.
-        native_min_value=-10000,
-        native_max_value=10000,
-        native_step=50,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=NumberDeviceClass.POWER,
-        mode=NumberMode.BOX,
-        icon="mdi:battery-arrow-up-outline",
-        register=1152,
-        raw_scale=1,
-    ),
-    VoltxNumberEntityDescription(
-        key="soc_max",
-        name="Battery SOC Max",
-        native_min_value=0,
-        native_max_value=100,
-        native_step=1,
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=NumberDeviceClass.BATTERY,
-        mode=NumberMode.BOX,
-        icon="mdi:battery-arrow-up",
-        register=1153,
-        raw_scale=100,
-    ),
-    VoltxNumberEntityDescription(
-        key="soc_min",
-        name="Battery SOC Min",
-        native_min_value=0,
-        native_max_value=100,
-        native_step=1,
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=NumberDeviceClass.BATTERY,
-        mode=NumberMode.BOX,
-        icon="mdi:battery-arrow-down",
-        register=1154,
-        raw_scale=100,
-    ),
+NUMBER_DESCRIPTIONS: Mapping[str, VoltxNumberEntityDescription] = MappingProxyType(
+    {
+        description.key: description
+        for description in (
+            VoltxNumberEntityDescription(
+                key="chpwr",
+                name="Battery Charge/Discharge Power",
+                # Positive = discharge, negative = charge (inverter convention).
+                # s16 register — _write_register masks to u16 for two's-complement.
+                native_min_value=-10000,
+                native_max_value=10000,
+                native_step=50,
+                native_unit_of_measurement=UnitOfPower.WATT,
+                device_class=NumberDeviceClass.POWER,
+                mode=NumberMode.BOX,
+                icon="mdi:battery-arrow-up-outline",
+                register=1152,
+                raw_scale=1,
+            ),
+            VoltxNumberEntityDescription(
+                key="soc_max",
+                name="Battery SOC Max",
+                native_min_value=0,
+                native_max_value=100,
+                native_step=1,
+                native_unit_of_measurement=PERCENTAGE,
+                device_class=NumberDeviceClass.BATTERY,
+                mode=NumberMode.BOX,
+                icon="mdi:battery-arrow-up",
+                register=1153,
+                raw_scale=100,
+            ),
+            VoltxNumberEntityDescription(
+                key="soc_min",
+                name="Battery SOC Min",
+                native_min_value=0,
+                native_max_value=100,
+                native_step=1,
+                native_unit_of_measurement=PERCENTAGE,
+                device_class=NumberDeviceClass.BATTERY,
+                mode=NumberMode.BOX,
+                icon="mdi:battery-arrow-down",
+                register=1154,
+                raw_scale=100,
+            ),
+        )
+    }
 )
 
 
+# ── Write helper ──────────────────────────────────────────────────────────────
+
+
+async def _write_scaled(
+    coordinator: VoltxModbusCoordinator,
+    key: str,
+    register: int,
+    raw_scale: int,
+    int_path: bool,
+    value: float,
+) -> None:
+    """Scale *value* to the raw register integer and write it via the coordinator.
+
+    Each number entity binds its own key, register and scale with functools.partial.
+    int_path is set when native_step and raw_scale are both integral, so the rounded
+    value can be scaled in int math instead of through a float multiply.
+    """
+    native: float = value
+    if int_path:
+        native = round(value)
+        raw = native * raw_scale
+    else:
+        raw = int(round(value * raw_scale))
+    data = coordinator.data
+    current = data.get(key) if data is not None else None
+    if current is not None and round(current * raw_scale) == raw:
+        # Already set; skip the round trip so the next poll is not held up behind it.
+        return
+    await coordinator.async_write_register(register, raw)
+    # The write succeeded (failures raise); show the new value now rather than after the refresh.
+    data = coordinator.data
+    if data is not None:
+        data[key] = native
+        coordinator.async_update_listeners()
+
+
 # ── Platform setup ────────────────────────────────────────────────────────────
 
 
@@ -93,11 +138,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Voltx Modbus number entities from a config entry."""
     coordinator: VoltxModbusCoordinator = entry.runtime_data
+    present = (coordinator.data or {}).keys() - async_disabled_keys(hass, entry, Platform.NUMBER)
 
     async_add_entities(
-        VoltxNumberEntity(coordinator, entry, description)
-        for description in NUMBER_DESCRIPTIONS
-        if description.key in (coordinator.data or {})
+        [
+            VoltxNumberEntity(coordinator, entry, NUMBER_DESCRIPTIONS[key])
+            for key in present & NUMBER_DESCRIPTIONS.keys()
+        ],
+        update_before_add=False,
     )
 
 
@@ -122,26 +170,36 @@ class VoltxNumberEntity(
         """Initialise the entity."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._key = description.key
+        self._get_value = coordinator.value_getter(description.key)
         self._attr_unique_id = f"{entry.unique_id}_{description.key}"
         self._attr_device_info = get_device_info(entry, description.key)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value from coordinator data."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self.entity_description.key)
+        int_path = float(description.native_step or 1).is_integer() and float(description.raw_scale).is_integer()
+        self._write = partial(
+            _write_scaled, coordinator, description.key, description.register, description.raw_scale, int_path
+        )
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
-        """Return True when the coordinator has data and the key is present."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and self.entity_description.key in self.coordinator.data
-        )
+        """Return the availability computed at the last coordinator update.
+
+        Overridden because CoordinatorEntity.available ignores _attr_available.
+        """
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached attributes, then write the new state."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Recompute cached attributes from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_available = self.coordinator.last_update_success and data is not None and self._key in data
+        self._attr_native_value = self._get_value()
 
     async def async_set_native_value(self, value: float) -> None:
         """Write the new value to the inverter via FC06."""
-        raw = int(round(value * self.entity_description.raw_scale))
-        await self.coordinator.async_write_register(self.entity_description.register, raw)
+        await self._write(value)
@@ -7,14 +7,18 @@ back the corresponding raw integer via FC06 through the coordinator.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import async_disabled_keys
 from .coordinator import VoltxModbusCoordinator
 from .device_info import get_device_info
 
@@ -26,8 +30,9 @@ class VoltxSelectEntityDescription(SelectEntityDescription):
     # FC03 holding register address to write
     register: int
     # Mapping from raw register integer to HA option label string.
-    # The reverse map (label → raw) is built automatically at entity init.
-    options_map: dict[int, str]
+    # Read-only (MappingProxyType) so entities can alias it without copying.
+    # The reverse map (label → raw) is built once in _REVERSE_MAPS below.
+    options_map: Mapping[int, str]
 
 
 # ── Select entity catalogue ───────────────────────────────────────────────────
@@ -45,23 +50,37 @@ class VoltxSelectEntityDescription(SelectEntityDescription):
 # reflect current charge/discharge state.  It is exposed as a text sensor (chflg)
 # but has no writable select entity because writes have no observable effect.
 # Register 1152 (chpwr) is the actual control register in Custom mode.
-SELECT_DESCRIPTIONS: tuple[VoltxSelectEntityDescription, ...] = (
-    VoltxSelectEntityDescription(
-        key="work_mode",
-        name="Work Mode",
-        icon="mdi:solar-power-variant",
-        register=1103,
-        options_map={
-            2: "Self-consumption",
-            3: "Reserve Power",
-            4: "Custom",
-            5: "Time of Use",
-        },
-        options=["Self-consumption", "Reserve Power", "Custom", "Time of Use"],
-    ),
+SELECT_DESCRIPTIONS: Mapping[str, VoltxSelectEntityDescription] = MappingProxyType(
+    {
+        description.key: description
+        for description in (
+            VoltxSelectEntityDescription(
+                key="work_mode",
+                name="Work Mode",
+                icon="mdi:solar-power-variant",
+                register=1103,
+                options_map=MappingProxyType(
+                    {
+                        2: "Self-consumption",
+                        3: "Reserve Power",
+                        4: "Custom",
+                        5: "Time of Use",
+                    }
+                ),
+                options=["Self-consumption", "Reserve Power", "Custom", "Time of Use"],
+            ),
+        )
+    }
 )
 
 
+# Option label → raw register value, per select key; shared by all entities.
+_REVERSE_MAPS: dict[str, Mapping[str, int]] = {
+    key: MappingProxyType({label: raw for raw, label in description.options_map.items()})
+    for key, description in SELECT_DESCRIPTIONS.items()
+}
+
+
 # ── Platform setup ────────────────────────────────────────────────────────────
 
 
@@ -72,11 +91,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Voltx Modbus select entities from a config entry."""
     coordinator: VoltxModbusCoordinator = entry.runtime_data
+    present = (coordinator.data or {}).keys() - async_disabled_keys(hass, entry, Platform.SELECT)
 
     async_add_entities(
-        VoltxSelectEntity(coordinator, entry, description)
-        for description in SELECT_DESCRIPTIONS
-        if description.key in (coordinator.data or {})
+        [
+            VoltxSelectEntity(coordinator, entry, SELECT_DESCRIPTIONS[key])
+            for key in present & SELECT_DESCRIPTIONS.keys()
+        ],
+        update_before_add=False,
     )
 
 
@@ -101,33 +123,44 @@ class VoltxSelectEntity(
         """Initialise the entity."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._key = description.key
+        self._get_value = coordinator.value_getter(description.key)
+        self._register = description.register
         self._attr_unique_id = f"{entry.unique_id}_{description.key}"
-        self._attr_options = list(description.options)
-        self._reverse_map: dict[str, int] = {label: raw for raw, label in description.options_map.items()}
+        self._attr_options = description.options
+        self._reverse_map = _REVERSE_MAPS[description.key]
+        self._options_get = description.options_map.get
         self._attr_device_info = get_device_info(entry, description.key)
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently active option label."""
-        if self.coordinator.data is None:
-            return None
-        raw = self.coordinator.data.get(self.entity_description.key)
-        if raw is None:
-            return None
-        return self.entity_description.options_map.get(raw)
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
-        """Return True when the coordinator has data and the key is present."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and self.entity_description.key in self.coordinator.data
-        )
+        """Return the availability computed at the last coordinator update.
+
+        Overridden because CoordinatorEntity.available ignores _attr_available.
+        """
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached attributes, then write the new state."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Recompute cached attributes from the latest coordinator data."""
+        data = self.coordinator.data
+        self._attr_available = self.coordinator.last_update_success and data is not None and self._key in data
+        raw = self._get_value()
+        self._attr_current_option = None if raw is None else self._options_get(raw)
 
     async def async_select_option(self, option: str) -> None:
         """Write the selected option's raw value to the inverter via FC06."""
         raw = self._reverse_map.get(option)
-        if raw is None:
+        if raw is None or self._get_value() == raw:
             return
-        await self.coordinator.async_write_register(self.entity_description.register, raw)
+        await self.coordinator.async_write_register(self._register, raw)
+        data = self.coordinator.data
+        if data is not None:
+            data[self._key] = raw
+            self.coordinator.async_update_listeners()